@@ -0,0 +1,12 @@
+import os
+import sys
+
+from ai_analysis.cli import EXIT_TIMED_OUT, main
+
+code = main()
+if code == EXIT_TIMED_OUT:
+    # Workers still blocked on a provider would otherwise hold up interpreter shutdown.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+sys.exit(code)
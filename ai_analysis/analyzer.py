@@ -2,6 +2,7 @@
 import json
 import logging
 import re
+import time
 from typing import Dict, List, Optional
 
 from groq import Groq
@@ -17,26 +18,42 @@ from dotenv import load_dotenv
 import os
 
 from ai_analysis.groqsetuptest import ChatGroq
+from instrumentation import metrics
+from instrumentation.profiling import configured_profiler, profile_run
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 load_dotenv()  # Load variables from .env
 
+LLM_REQUEST_SECONDS = metrics.histogram(
+    "ai_llm_request_seconds", "LLM call latency by provider, model and analysis type")
+LLM_REQUESTS = metrics.counter(
+    "ai_llm_requests_total", "LLM calls by provider, model and outcome")
+LLM_TOKENS = metrics.counter(
+    "ai_llm_tokens_total", "Prompt and completion tokens reported by the provider")
+PARSE_FAILURES = metrics.counter(
+    "ai_response_parse_failures_total", "LLM responses that did not yield valid JSON")
+LOG_PARSE_SECONDS = metrics.histogram(
+    "ai_log_parse_seconds", "Time spent reading and decoding JSON log files")
+
 
 class TestAnalyzer:
     """AI-powered test log analysis engine with multi-model support."""
 
-    def __init__(self, model_type: str = "groq"):
+    def __init__(self, model_type: str = "groq", profiler: Optional[str] = None):
         """
         Initialize the AI analyzer with specified model type.
 
         Args:
             model_type (str): One of "ollama", "openai", "gemini" or "groq"
+            profiler (str): "cprofile" or "pyinstrument" to profile each analysis run;
+                defaults to [METRICS] PROFILER in config.ini
         """
         self.config = ConfigParser()
         self.config.read('config/config.ini')
         self.model_type = model_type.lower()
+        self.profiler = profiler or configured_profiler()
         self.llm = self._initialize_model()
         self.prompt_templates = self._load_prompt_templates()
 
@@ -76,6 +93,7 @@ class TestAnalyzer:
         if self.model_type not in model_config:
             raise ValueError(f"Unsupported model type: {self.model_type}")
 
+        self.model_name = model_config[self.model_type]["params"]["model"]
         return model_config[self.model_type]["class"](**model_config[self.model_type]["params"])
 
     def _load_prompt_templates(self) -> Dict[str, PromptTemplate]:
@@ -115,15 +133,17 @@ class TestAnalyzer:
             Analysis results as dictionary
         """
         try:
-            with open(log_path) as f:
-                logs = [json.loads(line) for line in f]
-
-            if analysis_type == "root_cause":
-                return self._analyze_root_cause(logs)
-            elif analysis_type == "flakiness":
-                return self._analyze_flakiness(logs)
-            else:
-                raise ValueError(f"Unknown analysis type: {analysis_type}")
+            with profile_run(f"{self.model_type}_{analysis_type}", self.profiler):
+                with metrics.timer(LOG_PARSE_SECONDS, component="analyzer"):
+                    with open(log_path) as f:
+                        logs = [json.loads(line) for line in f]
+
+                if analysis_type == "root_cause":
+                    return self._analyze_root_cause(logs)
+                elif analysis_type == "flakiness":
+                    return self._analyze_flakiness(logs)
+                else:
+                    raise ValueError(f"Unknown analysis type: {analysis_type}")
 
         except Exception as e:
             logger.error(f"Analysis failed: {str(e)}")
@@ -136,17 +156,36 @@ class TestAnalyzer:
         # Create a callback handler to output verbose logs to the console.
         callback_handler = ConsoleCallbackHandler()
         # Pass the verbose flag and callbacks via the config
-        response = chain.invoke({"logs": logs}, config={"callbacks": [callback_handler], "verbose": True})
+        response = self._invoke(chain, {"logs": logs}, "root_cause",
+                                config={"callbacks": [callback_handler], "verbose": True})
         return self._parse_json_response(response)
 
     def _analyze_flakiness(self, logs: List[Dict]) -> Dict:
         """Calculate test flakiness score and patterns."""
         historical_data = self._aggregate_historical_data(logs)
         chain = self.prompt_templates["flakiness"] | self.llm
-        response = chain.invoke({"historical_data": historical_data})
+        response = self._invoke(chain, {"historical_data": historical_data}, "flakiness")
         return self._parse_json_response(response)
 
-    import re
+    def _invoke(self, chain, inputs: Dict, analysis_type: str, config: Optional[Dict] = None):
+        """Invoke the chain, recording latency, outcome and token usage."""
+        labels = {"provider": self.model_type, "model": self.model_name}
+        start = time.perf_counter()
+        try:
+            response = chain.invoke(inputs, config=config)
+        except Exception:
+            LLM_REQUESTS.inc(outcome="error", **labels)
+            raise
+        finally:
+            LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, analysis_type=analysis_type, **labels)
+        LLM_REQUESTS.inc(outcome="success", **labels)
+
+        # Chat models return a message with usage metadata; plain LLMs return a string.
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            LLM_TOKENS.inc(usage.get("input_tokens", 0), kind="prompt", **labels)
+            LLM_TOKENS.inc(usage.get("output_tokens", 0), kind="completion", **labels)
+        return response
 
     def _parse_json_response(self, response: str) -> Dict:
         """Parse LLM JSON response with error handling."""
@@ -158,6 +197,7 @@ class TestAnalyzer:
                 # Fallback: Try to find JSON without backticks
                 json_match = re.search(r'({.*})', response, re.DOTALL)
                 if not json_match:
+                    PARSE_FAILURES.inc(provider=self.model_type)
                     return {}
 
             json_str = json_match.group(1)
@@ -170,6 +210,7 @@ class TestAnalyzer:
             return json.loads(json_str)
         except (json.JSONDecodeError, AttributeError) as e:
             print(f"Error parsing JSON: {str(e)}")
+            PARSE_FAILURES.inc(provider=self.model_type)
             return {"raw_response": response}
 
     def _aggregate_historical_data(self, logs: List[Dict]) -> Dict:
@@ -189,16 +230,10 @@ class TestAnalyzer:
         return errors
 
 
-# Example usage
+# Example usage; see ai_analysis/cli.py for the full set of options
 if __name__ == "__main__":
-    os.system("ollama pull llama3.1:latest")  # Ensure the model is pulled before execution
-    analyzer = TestAnalyzer(model_type="groq")
+    import sys
 
-    # Analyze test failures
-    result = analyzer.analyze_logs(
-        log_path="reports/logs/test_logs.json",
-        analysis_type="root_cause"
-    )
+    from ai_analysis.cli import main
 
-    print("Root Cause Analysis Results:")
-    print(json.dumps(result, indent=2))
+    sys.exit(main(sys.argv[1:] or ["reports/logs/test_logs.json"]))
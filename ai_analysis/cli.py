@@ -0,0 +1,270 @@
+# ai_analysis/cli.py
+"""Headless entry point for CI: ``python -m ai_analysis reports/logs/*.json``."""
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from ai_analysis.router import is_valid_result
+from instrumentation import metrics
+from instrumentation.profiling import PROFILERS
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_TYPES = ("root_cause", "flakiness")
+PROVIDERS = ("ollama", "openai", "gemini", "groq")
+OUTPUT_FORMATS = ("json", "markdown", "junit")
+
+# Score field read for each analysis type and reported in the output.
+SCORE_FIELDS = {
+    "root_cause": "confidence_score",
+    "flakiness": "flakiness_score",
+}
+
+# Analysis types that gate CI. "above" breaches when the score is at or above the
+# threshold, "below" when it is under it. A confident root cause is not a failure,
+# so only flakiness gates by default; override with "analysis_gates" in config.json.
+DEFAULT_GATES = {
+    "flakiness": "above",
+}
+
+EXIT_OK = 0
+EXIT_THRESHOLD_BREACHED = 1
+EXIT_ANALYSIS_ERROR = 3
+EXIT_TIMED_OUT = 4
+
+
+def load_settings(path: str = 'config/config.json') -> Dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read {path}: {str(e)}")
+        return {}
+
+
+def expand_log_paths(patterns: List[str]) -> List[str]:
+    """Expand globs, keeping explicit paths that do not exist so they surface as errors."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        for path in matches or [pattern]:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def build_parser(settings: Dict) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_analysis",
+        description="Analyze test run logs with an LLM and gate CI on the results.",
+        epilog="Exit codes: 0 ok, 1 threshold breached, 2 usage error, "
+               "3 analysis error, 4 time budget exceeded.",
+    )
+    parser.add_argument("logs", nargs="+", help="Log file paths or glob patterns")
+    parser.add_argument("-t", "--analysis-type", dest="analysis_types", action="append",
+                        choices=ANALYSIS_TYPES, help="Analysis to run (repeatable, default: root_cause)")
+    parser.add_argument("-p", "--provider", choices=PROVIDERS,
+                        default=settings.get("ai_provider", "groq"), help="LLM provider")
+    parser.add_argument("--fallback", dest="fallbacks", action="append", choices=PROVIDERS,
+                        help="Backup provider hedged behind the primary (repeatable, in order)")
+    parser.add_argument("-j", "--concurrency", type=int,
+                        default=settings.get("analysis_concurrency", 4), help="Parallel analyses")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="json", help="Output format")
+    parser.add_argument("-o", "--output", help="Write results to this file instead of stdout")
+    parser.add_argument("--threshold", type=float, default=settings.get("analysis_threshold", 0.7),
+                        help="Score (0-1) compared against gated analyses (default gate: flakiness at or above)")
+    parser.add_argument("--time-budget", type=float,
+                        default=settings.get("analysis_time_budget_seconds", 300),
+                        help="Seconds allowed for the whole run; unfinished analyses are reported as timed out")
+    parser.add_argument("--profile", choices=PROFILERS,
+                        help="Profile each analysis run; output goes to [METRICS] PROFILE_DIR")
+    parser.add_argument("--metrics-file", help="Write Prometheus-format metrics to this file")
+    return parser
+
+
+def _score(result: Dict, analysis_type: str) -> Optional[float]:
+    """Score on a 0-1 scale; both prompts ask the model for 0-100."""
+    value = result.get(SCORE_FIELDS[analysis_type])
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value / 100
+
+
+def _breached(score: Optional[float], threshold: float, direction: Optional[str]) -> bool:
+    if score is None or direction is None:
+        return False
+    if direction == "above":
+        return score >= threshold
+    if direction == "below":
+        return score < threshold
+    raise ValueError(f"Unknown gate direction: {direction}")
+
+
+def _run_one(analyzer, log_path: str, analysis_type: str, threshold: float,
+             gates: Optional[Dict[str, str]] = None) -> Dict:
+    start = time.perf_counter()
+    if not os.path.exists(log_path):
+        result = {"error": f"Log file not found: {log_path}"}
+    else:
+        result = analyzer.analyze_logs(log_path, analysis_type)
+
+    entry = {
+        "log": log_path,
+        "analysis_type": analysis_type,
+        "duration_seconds": round(time.perf_counter() - start, 3),
+        "result": result,
+        "score": None,
+    }
+    if is_valid_result(result):
+        entry["score"] = _score(result, analysis_type)
+        direction = (DEFAULT_GATES if gates is None else gates).get(analysis_type)
+        entry["status"] = "breached" if _breached(entry["score"], threshold, direction) else "ok"
+    else:
+        entry["status"] = "error"
+    return entry
+
+
+def run_analyses(analyzer, log_paths: List[str], analysis_types: List[str], concurrency: int,
+                 threshold: float, time_budget: float, gates: Optional[Dict[str, str]] = None) -> List[Dict]:
+    """Run every (log, analysis type) pair in parallel within the time budget."""
+    jobs = [(path, analysis_type) for path in log_paths for analysis_type in analysis_types]
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    futures = {
+        executor.submit(_run_one, analyzer, path, analysis_type, threshold, gates): (path, analysis_type)
+        for path, analysis_type in jobs
+    }
+    done, _ = wait(futures, timeout=time_budget)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for future, (path, analysis_type) in futures.items():
+        if future in done:
+            try:
+                results.append(future.result())
+                continue
+            except Exception as e:
+                result, status = {"error": str(e)}, "error"
+        else:
+            result, status = {"error": f"Not finished within {time_budget}s budget"}, "timed_out"
+        results.append({"log": path, "analysis_type": analysis_type, "duration_seconds": None,
+                        "result": result, "score": None, "status": status})
+    return results
+
+
+def exit_code(results: List[Dict]) -> int:
+    statuses = {r["status"] for r in results}
+    if "timed_out" in statuses:
+        return EXIT_TIMED_OUT
+    if "error" in statuses:
+        return EXIT_ANALYSIS_ERROR
+    if "breached" in statuses:
+        return EXIT_THRESHOLD_BREACHED
+    return EXIT_OK
+
+
+def format_json(results: List[Dict], meta: Dict) -> str:
+    return json.dumps({**meta, "results": results}, indent=2, default=str)
+
+
+def format_markdown(results: List[Dict], meta: Dict) -> str:
+    lines = [
+        "# AI Test Analysis",
+        "",
+        f"Provider: `{meta['provider']}` | Threshold: {meta['threshold']} | Exit code: {meta['exit_code']}",
+        "",
+        "| Log | Analysis | Status | Score | Duration (s) |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for r in results:
+        score = "" if r["score"] is None else f"{r['score']:.2f}"
+        duration = "" if r["duration_seconds"] is None else r["duration_seconds"]
+        lines.append(f"| {r['log']} | {r['analysis_type']} | {r['status']} | {score} | {duration} |")
+    for r in results:
+        lines += ["", f"## {r['log']} — {r['analysis_type']}", "", "```json",
+                  json.dumps(r["result"], indent=2, default=str), "```"]
+    return "\n".join(lines) + "\n"
+
+
+def format_junit(results: List[Dict], meta: Dict) -> str:
+    suite = ET.Element("testsuite", {
+        "name": "ai_analysis",
+        "tests": str(len(results)),
+        "failures": str(sum(r["status"] == "breached" for r in results)),
+        "errors": str(sum(r["status"] in ("error", "timed_out") for r in results)),
+    })
+    properties = ET.SubElement(suite, "properties")
+    for name in ("provider", "threshold", "exit_code"):
+        ET.SubElement(properties, "property", {"name": name, "value": str(meta[name])})
+
+    for r in results:
+        case = ET.SubElement(suite, "testcase", {
+            "classname": r["log"],
+            "name": r["analysis_type"],
+            "time": str(r["duration_seconds"] or 0),
+        })
+        case_props = ET.SubElement(case, "properties")
+        for key, value in r["result"].items():
+            if not isinstance(value, str):
+                value = json.dumps(value, default=str)
+            ET.SubElement(case_props, "property", {"name": key, "value": value})
+        if r["status"] == "breached":
+            ET.SubElement(case, "failure", {
+                "message": f"{SCORE_FIELDS[r['analysis_type']]} {r['score']:.2f} breached threshold {meta['threshold']}"})
+        elif r["status"] in ("error", "timed_out"):
+            ET.SubElement(case, "error", {"message": str(r["result"].get("error", r["status"]))})
+    return ET.tostring(suite, encoding="unicode") + "\n"
+
+
+FORMATTERS = {
+    "json": format_json,
+    "markdown": format_markdown,
+    "junit": format_junit,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    settings = load_settings()
+    args = build_parser(settings).parse_args(argv)
+    logging.basicConfig(level=settings.get("log_level", "INFO"))
+
+    from ai_analysis.analyzer import TestAnalyzer
+    from ai_analysis.router import ProviderRouter
+
+    analysis_types = args.analysis_types or ["root_cause"]
+    log_paths = expand_log_paths(args.logs)
+    fallbacks = args.fallbacks if args.fallbacks is not None else settings.get("fallback_providers", [])
+    try:
+        if fallbacks:
+            providers = [args.provider] + [p for p in fallbacks if p != args.provider]
+            analyzer = ProviderRouter(providers, profiler=args.profile)
+        else:
+            analyzer = TestAnalyzer(model_type=args.provider, profiler=args.profile)
+    except Exception as e:
+        logger.error(f"Could not initialise {args.provider} analyzer: {str(e)}")
+        return EXIT_ANALYSIS_ERROR
+
+    gates = settings.get("analysis_gates", DEFAULT_GATES)
+    results = run_analyses(analyzer, log_paths, analysis_types, args.concurrency,
+                           args.threshold, args.time_budget, gates)
+    code = exit_code(results)
+    meta = {"provider": args.provider, "threshold": args.threshold, "exit_code": code}
+    if fallbacks:
+        meta["fallbacks"] = list(fallbacks)
+    report = FORMATTERS[args.format](results, meta)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        sys.stdout.write(report)
+    metrics.export(args.metrics_file)
+    return code
@@ -1,6 +1,11 @@
 import os
 from groq import Groq
 
+from instrumentation import metrics
+
+LLM_TOKENS = metrics.counter(
+    "ai_llm_tokens_total", "Prompt and completion tokens reported by the provider")
+
 class ChatGroq:
     def __init__(self, model: str, temperature: float = 0.5, api_key: str = None, **kwargs):
         if api_key is None:
@@ -23,6 +28,9 @@ class ChatGroq:
             model=self.model,
             temperature=self.temperature
         )
+        if response.usage:
+            LLM_TOKENS.inc(response.usage.prompt_tokens, kind="prompt", provider="groq", model=self.model)
+            LLM_TOKENS.inc(response.usage.completion_tokens, kind="completion", provider="groq", model=self.model)
         return response.choices[0].message.content
 
     def __call__(self, prompt: str) -> str:
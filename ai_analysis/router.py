@@ -0,0 +1,242 @@
+# ai_analysis/router.py
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from configparser import ConfigParser
+from typing import Dict, List, Optional
+
+from instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+ROUTER_HEDGES = metrics.counter(
+    "ai_router_hedges_total", "Backup provider requests started because the previous one was slow or failed")
+ROUTER_WINS = metrics.counter(
+    "ai_router_wins_total", "Analyses answered with valid JSON, by winning provider")
+CIRCUIT_TRANSITIONS = metrics.counter(
+    "ai_circuit_transitions_total", "Circuit breaker state changes by provider and new state")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_valid_result(result: Dict) -> bool:
+    """A usable analysis is non-empty JSON that is neither an error nor an unparsed response."""
+    return bool(result) and "error" not in result and "raw_response" not in result
+
+
+class CircuitBreaker:
+    """Rolling error-rate and latency breaker for a single provider"""
+
+    def __init__(self, provider: str, window: int = 20, min_requests: int = 5,
+                 error_rate: float = 0.5, slow_seconds: float = 60, cooldown_seconds: float = 30,
+                 trial_timeout_seconds: Optional[float] = None):
+        self.provider = provider
+        self.min_requests = min_requests
+        self.error_rate = error_rate
+        self.slow_seconds = slow_seconds
+        self.cooldown_seconds = cooldown_seconds
+        # A half-open trial that has not reported back by then is treated as abandoned;
+        # by default that is when it would count as a failure anyway.
+        self.trial_timeout_seconds = slow_seconds if trial_timeout_seconds is None else trial_timeout_seconds
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._latencies = deque(maxlen=100)
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str):
+        if state != self.state:
+            logger.info(f"Circuit for {self.provider}: {self.state} -> {state}")
+            self.state = state
+            CIRCUIT_TRANSITIONS.inc(provider=self.provider, state=state)
+
+    def allow(self) -> bool:
+        """Whether a request may be sent; an open circuit lets one trial through after the cooldown"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self.cooldown_seconds:
+                self._transition(HALF_OPEN)
+            if self._trial_in_flight and now - self._trial_started_at >= self.trial_timeout_seconds:
+                logger.info(f"Circuit for {self.provider}: trial request abandoned, allowing another")
+                self._trial_in_flight = False
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                self._trial_started_at = now
+                return True
+            return False
+
+    def record(self, ok: bool, latency: float):
+        # Answers slower than slow_seconds count against the provider even when valid.
+        ok = ok and latency < self.slow_seconds
+        with self._lock:
+            if ok:
+                self._latencies.append(latency)
+            if self.state == HALF_OPEN:
+                self._trial_in_flight = False
+                if ok:
+                    self._outcomes.clear()
+                    self._transition(CLOSED)
+                else:
+                    self._opened_at = time.monotonic()
+                    self._transition(OPEN)
+                return
+
+            self._outcomes.append(ok)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_requests and failures / len(self._outcomes) >= self.error_rate:
+                self._opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def latency_percentile(self, percentile: float, min_samples: int = 5) -> Optional[float]:
+        with self._lock:
+            if len(self._latencies) < min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+
+class ProviderRouter:
+    """
+    Hedged analysis across several providers.
+
+    The first available provider is asked first. If it has not answered within
+    its recent latency percentile (or fails), the next provider is started as
+    well, and the first valid JSON result wins. Providers whose circuit is open
+    are skipped, and no answer within REQUEST_TIMEOUT_SECONDS is an error.
+    Exposes the same ``analyze_logs`` call as ``TestAnalyzer``.
+
+    Provider calls cannot be cancelled once sent, so each runs on a daemon
+    thread: a losing or abandoned request finishes (and updates its breaker)
+    in the background without holding up interpreter exit.
+    """
+
+    def __init__(self, providers: Optional[List[str]] = None, profiler: Optional[str] = None):
+        self.config = ConfigParser()
+        self.config.read('config/config.ini')
+        section = 'ROUTING'
+
+        if providers is None:
+            configured = self.config.get(section, 'PROVIDERS', fallback='groq, ollama')
+            providers = [p.strip() for p in configured.split(',') if p.strip()]
+        if not providers:
+            raise ValueError("At least one provider is required")
+        self.providers = [p.lower() for p in providers]
+        self.profiler = profiler
+
+        self.hedge_percentile = self.config.getfloat(section, 'HEDGE_PERCENTILE', fallback=95)
+        self.hedge_min_delay = self.config.getfloat(section, 'HEDGE_MIN_DELAY_SECONDS', fallback=1)
+        self.hedge_default_delay = self.config.getfloat(section, 'HEDGE_DEFAULT_DELAY_SECONDS', fallback=10)
+        self.request_timeout = self.config.getfloat(section, 'REQUEST_TIMEOUT_SECONDS', fallback=120)
+        self.breakers = {
+            provider: CircuitBreaker(
+                provider,
+                window=self.config.getint(section, 'BREAKER_WINDOW', fallback=20),
+                min_requests=self.config.getint(section, 'BREAKER_MIN_REQUESTS', fallback=5),
+                error_rate=self.config.getfloat(section, 'BREAKER_ERROR_RATE', fallback=0.5),
+                slow_seconds=self.config.getfloat(section, 'BREAKER_SLOW_SECONDS', fallback=60),
+                cooldown_seconds=self.config.getfloat(section, 'BREAKER_COOLDOWN_SECONDS', fallback=30),
+                trial_timeout_seconds=self.request_timeout,
+            )
+            for provider in self.providers
+        }
+        self._analyzers: Dict[str, object] = {}
+        self._analyzer_lock = threading.Lock()
+
+    def _analyzer(self, provider: str):
+        with self._analyzer_lock:
+            if provider not in self._analyzers:
+                from ai_analysis.analyzer import TestAnalyzer
+                self._analyzers[provider] = TestAnalyzer(model_type=provider, profiler=self.profiler)
+            return self._analyzers[provider]
+
+    def _call(self, provider: str, log_path: str, analysis_type: str) -> Dict:
+        start = time.perf_counter()
+        try:
+            result = self._analyzer(provider).analyze_logs(log_path, analysis_type)
+        except Exception as e:
+            # analyze_logs handles its own errors; this covers provider initialisation.
+            result = {"error": str(e)}
+        self.breakers[provider].record(is_valid_result(result), time.perf_counter() - start)
+        return result
+
+    def _submit(self, provider: str, log_path: str, analysis_type: str) -> Future:
+        future = Future()
+
+        def run():
+            future.set_result(self._call(provider, log_path, analysis_type))
+
+        threading.Thread(target=run, name=f"provider-router-{provider}", daemon=True).start()
+        return future
+
+    def hedge_delay(self, provider: str) -> float:
+        observed = self.breakers[provider].latency_percentile(self.hedge_percentile)
+        if observed is None:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, observed)
+
+    def analyze_logs(self, log_path: str, analysis_type: str = "root_cause") -> Dict:
+        """
+        Analyze test logs through the fastest healthy provider.
+
+        Returns:
+            The first valid analysis, or {"error": ..., "providers": {...}} when none succeeded
+        """
+        candidates = iter(p for p in self.providers if self.breakers[p].allow())
+        pending = {}
+        errors = {}
+        deadline = None
+        give_up_at = time.monotonic() + self.request_timeout
+
+        def launch() -> bool:
+            nonlocal deadline
+            provider = next(candidates, None)
+            if provider is None:
+                return False
+            if pending or errors:
+                ROUTER_HEDGES.inc(provider=provider)
+            pending[self._submit(provider, log_path, analysis_type)] = provider
+            deadline = time.monotonic() + self.hedge_delay(provider)
+            return True
+
+        if not launch():
+            return {"error": "All providers unavailable (circuit open)"}
+
+        while pending:
+            now = time.monotonic()
+            if now >= give_up_at:
+                for provider in pending.values():
+                    errors[provider] = f"No answer within {self.request_timeout}s"
+                break
+            timeout = min(deadline, give_up_at) - now if deadline is not None else give_up_at - now
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if deadline is None or time.monotonic() < deadline:
+                    continue
+                # Slowest acceptable answer from the latest provider has passed: hedge.
+                if not launch():
+                    deadline = None
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                result = future.result()
+                if is_valid_result(result):
+                    ROUTER_WINS.inc(provider=provider)
+                    logger.info(f"{analysis_type} analysis answered by {provider}")
+                    return result
+                errors[provider] = result.get("error", result.get("raw_response", "empty response"))
+
+            if not pending and not launch():
+                break
+
+        return {"error": "All providers failed", "providers": errors}
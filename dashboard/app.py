@@ -15,6 +15,11 @@ from langchain_openai import ChatOpenAI
 
 from ai_analysis.analyzer import TestAnalyzer
 from ai_analysis.groqsetuptest import ChatGroq
+from instrumentation import metrics
+from tests_suite.rollups import RollupStore
+
+DASHBOARD_SECONDS = metrics.histogram(
+    "dashboard_seconds", "Dashboard script rerun time by phase (load, drilldown_load, aggregate, render, rerun)")
 
 # Initialize Groq client
 client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
@@ -57,14 +62,15 @@ def _initialize_model(self):
 
 
 
-def load_test_logs() -> List[Dict]:
-    """Load and validate test logs with error handling"""
-    try:
-        with open('reports/logs/test_logs.json') as f:
-            return [json.loads(line) for line in f]
-    except Exception as e:
-        st.error(f"Error loading logs: {str(e)}")
-        return []
+LOG_PATH = 'reports/logs/test_logs.json'
+
+
+def load_rollups(start_date, end_date) -> pd.DataFrame:
+    """Daily rollups in range; history logged before rollups existed is backfilled once"""
+    store = RollupStore(log_path=LOG_PATH)
+    store.backfill()
+    return pd.DataFrame(store.query(start_date, end_date))
+
 
 def parse_ai_response(response: str) -> Dict:
     """Safely parse AI response with multiple fallback strategies"""
@@ -122,19 +128,6 @@ def main():
     )
     st.title("🔍 AI-Powered Test Analysis Portal")
 
-    # Load data
-    logs = load_test_logs()
-    if not logs:
-        st.warning("No test logs found. Run tests first!")
-        return
-
-    df = pd.DataFrame(logs)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-
-    # Ensure testname is used instead of test_id
-    if 'testname' in df.columns:
-        df.rename(columns={"test_id": "testname"}, inplace=True)
-
     # Date Selection Section
     st.sidebar.header("🕰 Date & Time Filter")
 
@@ -145,43 +138,48 @@ def main():
     start_date = st.sidebar.date_input("Start Date", value=default_start.date())
     end_date = st.sidebar.date_input("End Date", value=datetime.today().date())
 
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
+    # Load data; tables and charts are driven by the per day x test x status rollups
+    with metrics.timer(DASHBOARD_SECONDS, phase="load"):
+        rollup_df = load_rollups(start_date, end_date)
+    if rollup_df.empty and not os.path.exists(LOG_PATH):
+        st.warning("No test logs found. Run tests first!")
+        return
 
-    # Filter dataframe
-    time_mask = (df['timestamp'] >= start_dt) & (df['timestamp'] <= end_dt)
-    filtered_df = df[time_mask].copy()
-    filtered_df['date'] = filtered_df['timestamp'].dt.date
+    executions = int(rollup_df['count'].sum()) if not rollup_df.empty else 0
 
     # Show date range info
     st.sidebar.markdown(f"""
     **Selected Range:**  
     {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}  
-    ({len(filtered_df)} test executions)
+    ({executions} test executions)
     """)
 
     # Section 1: Test Case History Table
     st.header("📋 Test Case History")
 
-    if filtered_df.empty:
+    if rollup_df.empty:
         st.warning("No test executions found in selected date range")
         return
 
-    history_df = filtered_df.groupby(['testname', 'status']).agg({
-        'timestamp': ['min', 'max', 'count'],
-        'error': 'last'
-    }).reset_index()
-
-    st.dataframe(
-        history_df,
-        use_container_width=True,
-        height=400
-    )
+    with metrics.timer(DASHBOARD_SECONDS, phase="aggregate"):
+        history_df = rollup_df.sort_values('last_timestamp').groupby(['testname', 'status']).agg(
+            first_run=('first_timestamp', 'min'),
+            last_run=('last_timestamp', 'max'),
+            count=('count', 'sum'),
+            last_error=('last_error', 'last'),
+        ).reset_index()
+
+    with metrics.timer(DASHBOARD_SECONDS, phase="render"):
+        st.dataframe(
+            history_df,
+            use_container_width=True,
+            height=400
+        )
 
     # Section 2: Detailed Failure Analysis
     st.header("🛑 Failure Analysis")
 
-    failed_tests = filtered_df[filtered_df['status'] == 'FAIL']['testname'].unique()
+    failed_tests = rollup_df[rollup_df['status'] == 'FAIL']['testname'].unique()
 
     if len(failed_tests) == 0:
         st.success("🎉 No failed tests in selected period!")
@@ -190,7 +188,17 @@ def main():
     selected_test = st.selectbox("Select Failed Test Case", failed_tests)
 
     if selected_test:
-        test_data = filtered_df[filtered_df['testname'] == selected_test].iloc[0]
+        # Latest failure of the selected test, straight from its rollup rows
+        with metrics.timer(DASHBOARD_SECONDS, phase="drilldown_load"):
+            latest = rollup_df[
+                (rollup_df['testname'] == selected_test) & (rollup_df['status'] == 'FAIL')
+            ].sort_values('last_timestamp').iloc[-1]
+        test_data = pd.Series({
+            'testname': selected_test,
+            'timestamp': pd.to_datetime(latest['last_timestamp']),
+            'status': latest['status'],
+            'error': latest['last_error'],
+        })
 
         col1, col2 = st.columns(2)
 
@@ -229,10 +237,17 @@ def main():
     st.header("📈 Historical Trends")
 
     try:
-        trend_data = filtered_df.groupby(['date', 'status']).size().unstack().fillna(0)
-        st.line_chart(trend_data)
+        with metrics.timer(DASHBOARD_SECONDS, phase="aggregate"):
+            trend_data = rollup_df.pivot_table(
+                index='date', columns='status', values='count', aggfunc='sum'
+            ).fillna(0)
+        with metrics.timer(DASHBOARD_SECONDS, phase="render"):
+            st.line_chart(trend_data)
     except Exception as e:
         st.error(f"Couldn't generate trends: {str(e)}")
 
 if __name__ == "__main__":
-    main()
+    metrics.serve_from_config()
+    with metrics.timer(DASHBOARD_SECONDS, phase="rerun"):
+        main()
+    metrics.export()
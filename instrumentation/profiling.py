@@ -0,0 +1,76 @@
+# instrumentation/profiling.py
+import cProfile
+import logging
+import os
+import re
+from configparser import ConfigParser
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+def configured_profiler() -> Optional[str]:
+    """Profiler named by AI_ANALYSIS_PROFILER or [METRICS] PROFILER, if any"""
+    config = ConfigParser()
+    config.read('config/config.ini')
+    name = os.getenv("AI_ANALYSIS_PROFILER") or config.get('METRICS', 'PROFILER', fallback='')
+    return name.lower() or None
+
+
+def _output_path(name: str, extension: str) -> str:
+    config = ConfigParser()
+    config.read('config/config.ini')
+    profile_dir = config.get('METRICS', 'PROFILE_DIR', fallback='reports/profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(profile_dir, f"{safe_name}_{timestamp}.{extension}")
+
+
+@contextmanager
+def profile_run(name: str, profiler: Optional[str] = None) -> Iterator[None]:
+    """
+    Profile the enclosed block when a profiler is selected.
+
+    cProfile writes a .pstats file (open with ``python -m pstats`` or snakeviz);
+    pyinstrument writes an HTML flame report. Both only see the calling thread.
+    """
+    profiler = (profiler or '').lower() or None
+    if profiler is None:
+        yield
+        return
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unsupported profiler: {profiler}")
+
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed; running without profiling")
+            yield
+            return
+        session = Profiler()
+        session.start()
+        try:
+            yield
+        finally:
+            session.stop()
+            path = _output_path(name, "html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(session.output_html())
+            logger.info(f"Profile written to {path}")
+        return
+
+    session = cProfile.Profile()
+    session.enable()
+    try:
+        yield
+    finally:
+        session.disable()
+        path = _output_path(name, "pstats")
+        session.dump_stats(path)
+        logger.info(f"Profile written to {path}")
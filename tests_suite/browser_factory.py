@@ -1,24 +1,262 @@
-from selenium import webdriver
+import os
+import shutil
+import statistics
+import tempfile
+import time
 from configparser import ConfigParser
+from typing import Dict, Optional
+
+from selenium import webdriver
+
+CONFIG_PATH = 'config/config.ini'
+
+# Request patterns blocked through CDP when the fast profile is active.
+DEFAULT_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+]
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+# Lock files a running browser leaves in its profile; never copied into a driver's profile.
+PROFILE_LOCK_FILES = ("Singleton*", "lockfile", "lock", "parent.lock", ".parentlock")
+
+# Option names accepted in [FAST_PROFILE] and by the ``browser_profile`` marker.
+FAST_PROFILE_OPTIONS = (
+    "page_load_strategy",
+    "disable_images",
+    "disable_fonts",
+    "block_urls",
+    "disable_extensions",
+    "disable_gpu",
+    "disable_background_throttling",
+    "profile_dir",
+)
+
+
+def _load_config() -> ConfigParser:
+    config = ConfigParser()
+    config.read(CONFIG_PATH)
+    return config
 
-config = ConfigParser()
-config.read('config/config.ini')
-print("Available config sections:", config.sections())
-print("Available options in DEFAULT:", config.defaults())
 
 class browser_factory:
     @staticmethod
-    def get_driver():
+    def fast_profile_settings(config: Optional[ConfigParser] = None, **overrides) -> Dict:
+        """Resolve fast-profile options from config.ini, applying per-test overrides"""
+        config = config or _load_config()
+        section = 'FAST_PROFILE'
+        # An empty BLOCK_URLS turns blocking off; the defaults apply only when the key is absent.
+        blocked = config.get(section, 'BLOCK_URLS', fallback=None)
+        settings = {
+            "page_load_strategy": config.get(section, 'PAGE_LOAD_STRATEGY', fallback='eager'),
+            "disable_images": config.getboolean(section, 'DISABLE_IMAGES', fallback=True),
+            "disable_fonts": config.getboolean(section, 'DISABLE_FONTS', fallback=True),
+            "block_urls": (list(DEFAULT_BLOCKED_URLS) if blocked is None
+                           else [u.strip() for u in blocked.split(',') if u.strip()]),
+            "disable_extensions": config.getboolean(section, 'DISABLE_EXTENSIONS', fallback=True),
+            "disable_gpu": config.getboolean(section, 'DISABLE_GPU', fallback=True),
+            "disable_background_throttling": config.getboolean(
+                section, 'DISABLE_BACKGROUND_THROTTLING', fallback=True),
+            "profile_dir": config.get(section, 'PROFILE_DIR', fallback='') or None,
+        }
+
+        unknown = set(overrides) - set(FAST_PROFILE_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown fast profile options: {', '.join(sorted(unknown))}")
+        if isinstance(overrides.get("block_urls"), str):
+            # A bare pattern would otherwise be split into characters, and "*" blocks everything.
+            overrides["block_urls"] = [overrides["block_urls"]]
+        if "block_urls" in overrides and not isinstance(overrides["block_urls"], (list, tuple)):
+            raise ValueError("block_urls must be a URL pattern or a list of patterns")
+        settings.update(overrides)
+        return settings
+
+    @staticmethod
+    def get_driver(profile: Optional[str] = None, **overrides):
+        """
+        Create a WebDriver for the configured browser.
+
+        Args:
+            profile: "default" or "fast"; falls back to BROWSER_PROFILE in config.ini
+            overrides: Fast profile options (see FAST_PROFILE_OPTIONS) to change for this driver
+        """
+        config = _load_config()
         browser = config.get('DEFAULT', 'BROWSER', fallback='chrome')
-        
+        headless = config.getboolean('DEFAULT', 'HEADLESS', fallback=False)
+        profile = (profile or config.get('DEFAULT', 'BROWSER_PROFILE', fallback='default')).lower()
+
+        if profile == 'fast':
+            fast = browser_factory.fast_profile_settings(config, **overrides)
+        elif profile == 'default':
+            if overrides:
+                raise ValueError(
+                    f"Fast profile options given for the default profile: {', '.join(sorted(overrides))}")
+            fast = None
+        else:
+            raise ValueError(f"Unsupported browser profile: {profile}")
+
+        profile_copy = None
+        if fast and fast["profile_dir"]:
+            # Each driver gets its own copy: the template stays pristine, and Chrome's
+            # profile lock no longer stops two drivers from sharing it.
+            profile_copy = browser_factory._copy_profile(fast["profile_dir"])
+            fast = {**fast, "profile_dir": profile_copy}
+        try:
+            driver = browser_factory._create_driver(browser, headless, fast)
+        except Exception:
+            if profile_copy:
+                shutil.rmtree(profile_copy, ignore_errors=True)
+            raise
+        if profile_copy:
+            browser_factory._remove_on_quit(driver, profile_copy)
+        return driver
+
+    @staticmethod
+    def _create_driver(browser: str, headless: bool, fast: Optional[Dict]):
         if browser.lower() == 'chrome':
             options = webdriver.ChromeOptions()
-            if config.getboolean('DEFAULT', 'HEADLESS'):
+            if headless:
                 options.add_argument("--headless=new")
-            return webdriver.Chrome(options=options)
-            
+            if fast:
+                browser_factory._apply_chrome_fast_profile(options, fast)
+            driver = webdriver.Chrome(options=options)
+            if fast:
+                blocked = list(fast["block_urls"])
+                if fast["disable_fonts"]:
+                    blocked += FONT_URL_PATTERNS
+                if blocked:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": blocked})
+            return driver
+
         elif browser.lower() == 'firefox':
-            return webdriver.Firefox()
-            
+            options = webdriver.FirefoxOptions()
+            if headless:
+                options.add_argument("-headless")
+            if fast:
+                browser_factory._apply_firefox_fast_profile(options, fast)
+            return webdriver.Firefox(options=options)
+
         else:
-            raise ValueError(f"Unsupported browser: {browser}")
\ No newline at end of file
+            raise ValueError(f"Unsupported browser: {browser}")
+
+    @staticmethod
+    def _copy_profile(template: str) -> str:
+        """Copy a preloaded profile into a fresh temp directory, skipping lock files"""
+        if not os.path.isdir(template):
+            raise ValueError(f"Browser profile directory not found: {template}")
+        profile_copy = tempfile.mkdtemp(prefix="browser-profile-")
+        shutil.copytree(template, profile_copy, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(*PROFILE_LOCK_FILES))
+        return profile_copy
+
+    @staticmethod
+    def _remove_on_quit(driver, profile_copy: str):
+        quit_driver = driver.quit
+
+        def quit_and_remove():
+            try:
+                quit_driver()
+            finally:
+                shutil.rmtree(profile_copy, ignore_errors=True)
+
+        driver.quit = quit_and_remove
+
+    @staticmethod
+    def _apply_chrome_fast_profile(options, fast: Dict):
+        options.page_load_strategy = fast["page_load_strategy"]
+        if fast["disable_images"]:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2})
+        if fast["disable_extensions"]:
+            options.add_argument("--disable-extensions")
+        if fast["disable_gpu"]:
+            options.add_argument("--disable-gpu")
+        if fast["disable_background_throttling"]:
+            options.add_argument("--disable-background-timer-throttling")
+            options.add_argument("--disable-backgrounding-occluded-windows")
+            options.add_argument("--disable-renderer-backgrounding")
+        if fast["profile_dir"]:
+            options.add_argument(f"--user-data-dir={fast['profile_dir']}")
+
+    @staticmethod
+    def _apply_firefox_fast_profile(options, fast: Dict):
+        # Firefox has no CDP URL blocking, so only the preference-based options apply.
+        options.page_load_strategy = fast["page_load_strategy"]
+        if fast["disable_images"]:
+            options.set_preference("permissions.default.image", 2)
+        if fast["disable_fonts"]:
+            options.set_preference("browser.display.use_document_fonts", 0)
+        if fast["disable_extensions"]:
+            options.set_preference("extensions.enabledScopes", 0)
+        if fast["disable_gpu"]:
+            options.set_preference("layers.acceleration.disabled", True)
+        if fast["disable_background_throttling"]:
+            options.set_preference("dom.min_background_timeout_value", 0)
+        if fast["profile_dir"]:
+            options.add_argument("-profile")
+            options.add_argument(fast["profile_dir"])
+
+    @staticmethod
+    def benchmark(urls, runs: int = 5, **overrides) -> Dict[str, Dict[str, float]]:
+        """
+        Compare page-load time per navigation between the default and fast profiles.
+
+        Both browsers get an untimed warm-up pass first, and the profile that navigates
+        first alternates between runs, so DNS and server-side caching do not favour
+        either side. Medians are reported alongside means.
+        """
+        urls = [urls] if isinstance(urls, str) else list(urls)
+        if not urls:
+            raise ValueError("benchmark needs at least one URL")
+        if runs < 1:
+            raise ValueError("benchmark needs at least one run")
+
+        timings = {'default': [], 'fast': []}
+        drivers = {}
+        try:
+            drivers['default'] = browser_factory.get_driver('default')
+            drivers['fast'] = browser_factory.get_driver('fast', **overrides)
+            for driver in drivers.values():
+                for url in urls:
+                    driver.get(url)
+
+            for run in range(runs):
+                order = ('default', 'fast') if run % 2 == 0 else ('fast', 'default')
+                for url in urls:
+                    for profile in order:
+                        start = time.perf_counter()
+                        drivers[profile].get(url)
+                        timings[profile].append(time.perf_counter() - start)
+        finally:
+            for driver in drivers.values():
+                driver.quit()
+
+        results = {
+            profile: {
+                "navigations": len(samples),
+                "median_seconds": statistics.median(samples),
+                "avg_seconds": statistics.mean(samples),
+                "max_seconds": max(samples),
+            }
+            for profile, samples in timings.items()
+        }
+        default_median = results['default']['median_seconds']
+        results['speedup_percent'] = (
+            (default_median - results['fast']['median_seconds']) / default_median * 100
+            if default_median else 0.0)
+        return results
+
+
+# Built-in comparison benchmark:
+#   python -m tests_suite.browser_factory http://the-internet.herokuapp.com/login
+if __name__ == "__main__":
+    import json
+    import sys
+
+    target_urls = sys.argv[1:] or ["http://the-internet.herokuapp.com/login"]
+    print(json.dumps(browser_factory.benchmark(target_urls), indent=2))
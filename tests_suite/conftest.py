@@ -1,8 +1,35 @@
 import sys
 import os
 
+import pytest
+
 PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-print(f"✅ Added {PROJECT_ROOT} to sys.path")
\ No newline at end of file
+print(f"✅ Added {PROJECT_ROOT} to sys.path")
+
+from instrumentation import metrics
+
+
+def pytest_configure(config):
+    metrics.serve_from_config()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Logger and screenshot timings only live in this process; each xdist worker writes its own file.
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    metrics.export(program=f"pytest-{worker}" if worker else "pytest")
+
+
+@pytest.fixture
+def browser_profile(request):
+    """
+    Driver arguments from the ``browser_profile`` marker, e.g.
+    ``@pytest.mark.browser_profile("fast", disable_images=False)``.
+    """
+    marker = request.node.get_closest_marker("browser_profile")
+    if marker is None:
+        return {}
+    profile = marker.args[0] if marker.args else "fast"
+    return {"profile": profile, **marker.kwargs}
@@ -3,6 +3,13 @@ from pythonjsonlogger import jsonlogger
 import inspect
 import datetime
 
+from instrumentation import metrics
+from tests_suite.rollups import RollupStore
+
+LOG_WRITE_SECONDS = metrics.histogram(
+    "test_log_write_seconds", "Time to write a test result to the JSON log and rollups")
+TEST_RESULTS = metrics.counter("test_results_total", "Logged test results by status")
+
 
 class JSONLogger:
     def __init__(self):
@@ -16,6 +23,7 @@ class JSONLogger:
         )
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        self.rollups = RollupStore()
 
     def log_test_step(self, status, msg, test_name, error=None):
         # Extract the calling test function name
@@ -26,4 +34,7 @@ class JSONLogger:
             "error": str(error) if error else None,
             "msg": msg
         }
-        self.logger.info(log_data)
+        with metrics.timer(LOG_WRITE_SECONDS):
+            self.logger.info(log_data)
+            self.rollups.record(test_name, status, log_data["timestamp"], log_data["error"])
+        TEST_RESULTS.inc(status=status)
@@ -0,0 +1,293 @@
+# tests_suite/report_generator.py
+import base64
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import shutil
+from collections import OrderedDict
+from configparser import ConfigParser
+from datetime import datetime, timedelta
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+from instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+# Bump when fragment markup changes so cached fragments are rebuilt.
+FRAGMENT_VERSION = "2"
+REPORT_FRAGMENTS = metrics.counter(
+    "report_fragments_total", "Report fragments rendered or reused from the fragment cache")
+SCREENSHOT_PATTERN = re.compile(r"^(?P<test_id>.+)_full_(?P<stamp>\d{8}_\d{6})(?P<annotated>_annotated)?\.png$")
+
+
+class ReportGenerator:
+    """Incremental, self-contained HTML report built from run logs, AI analyses and screenshots"""
+
+    def __init__(self, log_path: Optional[str] = None, output_path: Optional[str] = None,
+                 embed_screenshots: bool = True):
+        self.config = ConfigParser()
+        self.config.read('config/config.ini')
+
+        self.log_path = log_path or self.config.get('PATHS', 'LOG_FILE', fallback='reports/logs/test_logs.json')
+        self.output_path = output_path or self.config.get('PATHS', 'REPORT_FILE', fallback='reports/test-report.html')
+        self.screenshot_dir = self.config.get('PATHS', 'SCREENSHOT_DIR', fallback='reports/screenshots')
+        self.ai_report_dir = self.config.get('PATHS', 'AI_REPORT_DIR', fallback='reports/ai_reports')
+        self.analysis_file = self.config.get('PATHS', 'AI_ANALYSIS_FILE',
+                                             fallback='reports/ai_reports/analysis.json')
+        self.stylesheet = self.config.get('PATHS', 'REPORT_STYLESHEET', fallback='reports/assets/style.css')
+        self.cache_dir = self.config.get('PATHS', 'REPORT_CACHE_DIR', fallback='reports/.report_cache')
+        self.embed_screenshots = embed_screenshots
+        self.screenshot_window = timedelta(
+            seconds=self.config.getint('SCREENSHOTS', 'MATCH_WINDOW_SECONDS', fallback=30))
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+    def _load_records(self) -> "OrderedDict[str, List[Dict]]":
+        """Group log records by test name, preserving first-seen order"""
+        grouped: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        try:
+            with open(self.log_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed log line in {self.log_path}")
+                        continue
+                    grouped.setdefault(record.get('testname', 'unknown'), []).append(record)
+        except FileNotFoundError:
+            logger.error(f"Log file not found: {self.log_path}")
+        return grouped
+
+    def _load_screenshots(self) -> List[Tuple[datetime, str, str]]:
+        """Index screenshots as (capture time, test id, path), preferring annotated copies"""
+        by_stem: Dict[str, Tuple[datetime, str, str]] = {}
+        if not os.path.isdir(self.screenshot_dir):
+            return []
+        for name in sorted(os.listdir(self.screenshot_dir)):
+            match = SCREENSHOT_PATTERN.match(name)
+            if not match:
+                continue
+            taken = datetime.strptime(match.group('stamp'), "%Y%m%d_%H%M%S")
+            stem = f"{match.group('test_id')}_{match.group('stamp')}"
+            if stem not in by_stem or match.group('annotated'):
+                by_stem[stem] = (taken, match.group('test_id'), os.path.join(self.screenshot_dir, name))
+        return sorted(by_stem.values())
+
+    def _match_screenshots(self, test_name: str, records: List[Dict],
+                           screenshots: List[Tuple[datetime, str, str]], test_names: Collection[str],
+                           claimed: Set[str]) -> List[str]:
+        """
+        Pair each failure with the first unclaimed screenshot taken within the match
+        window after its logged asctime. Screenshots named after a logged test only
+        match that test; older ones with a random test id match by time alone.
+        """
+        matched = []
+        for record in records:
+            if record.get('status') != 'FAIL' or not record.get('asctime'):
+                continue
+            try:
+                logged = datetime.strptime(record['asctime'], "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                continue
+            for taken, test_id, path in screenshots:
+                if path in claimed or not logged <= taken <= logged + self.screenshot_window:
+                    continue
+                if test_id == test_name or test_id not in test_names:
+                    claimed.add(path)
+                    matched.append(path)
+                    break
+        return matched
+
+    def _load_analyses(self) -> List[Dict]:
+        """Results for this log from ``python -m ai_analysis --format json`` output"""
+        try:
+            with open(self.analysis_file) as f:
+                results = json.load(f).get('results', [])
+        except FileNotFoundError:
+            return []
+        except (json.JSONDecodeError, AttributeError):
+            logger.warning(f"Ignoring unreadable AI analysis file: {self.analysis_file}")
+            return []
+        log_path = os.path.normpath(self.log_path)
+        return [r for r in results if os.path.normpath(r.get('log', '')) == log_path]
+
+    # ------------------------------------------------------------------
+    # Fragments
+    # ------------------------------------------------------------------
+    def _fragment_key(self, test_name: str, records: List[Dict], screenshots: List[str]) -> str:
+        """Content hash of everything a test's fragment is rendered from"""
+        digest = hashlib.sha256()
+        digest.update(FRAGMENT_VERSION.encode())
+        digest.update(str(self.embed_screenshots).encode())
+        digest.update(test_name.encode())
+        digest.update(json.dumps(records, sort_keys=True, default=str).encode())
+        for path in screenshots:
+            # Stat signature instead of pixel bytes: screenshots are write-once.
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def _render_fragment(self, test_name: str, records: List[Dict], screenshots: List[str]) -> str:
+        esc = html.escape
+        failures = sum(1 for r in records if r.get('status') == 'FAIL')
+        outcome = 'failed' if failures else 'passed'
+        parts = [
+            f'<tbody class="results-table-row">',
+            f'<tr class="collapsible"><td class="col-result {outcome}">{outcome.title()}</td>'
+            f'<td class="col-name">{esc(test_name)}</td>'
+            f'<td>{len(records)}</td><td>{failures}</td></tr>',
+            '<tr class="extras-row"><td class="extra" colspan="4">',
+            '<div class="logwrapper"><div class="log">',
+        ]
+        for record in records:
+            line = f"{record.get('timestamp', '')} {record.get('status', '')} {record.get('msg', '')}"
+            if record.get('error'):
+                line += f"\n{record['error']}"
+            parts.append(esc(line) + '\n')
+        parts.append('</div></div>')
+
+        if screenshots:
+            parts.append('<div class="media">')
+            for path in screenshots:
+                if self.embed_screenshots:
+                    with open(path, 'rb') as f:
+                        src = "data:image/png;base64," + base64.b64encode(f.read()).decode('ascii')
+                else:
+                    src = os.path.relpath(path, os.path.dirname(self.output_path) or '.')
+                parts.append(f'<img src="{esc(src)}" alt="{esc(os.path.basename(path))}"/>')
+            parts.append('</div>')
+
+        parts.append('</td></tr></tbody>\n')
+        return ''.join(parts)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(os.path.join(self.cache_dir, 'manifest.json')) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        path = os.path.join(self.cache_dir, 'manifest.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def _write_header(self, out, grouped: "OrderedDict[str, List[Dict]]"):
+        try:
+            with open(self.stylesheet) as f:
+                css = f.read()
+        except FileNotFoundError:
+            logger.warning(f"Stylesheet not found: {self.stylesheet}")
+            css = ''
+
+        total = len(grouped)
+        failed = sum(1 for records in grouped.values() if any(r.get('status') == 'FAIL' for r in records))
+        title = html.escape(os.path.basename(self.output_path))
+        out.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8"/>\n')
+        out.write(f'<title id="head-title">{title}</title>\n<style>\n{css}\n</style>\n</head>\n<body>\n')
+        out.write(f'<h1 id="title">{title}</h1>\n')
+        out.write(f'<p>Report generated on {datetime.now().strftime("%d-%b-%Y at %H:%M:%S")}</p>\n')
+        out.write('<div class="summary"><div class="summary__data">')
+        out.write(f'<p class="run-count">{total} tests</p>')
+        out.write(f'<span class="passed">{total - failed} Passed</span>, ')
+        out.write(f'<span class="failed">{failed} Failed</span>')
+        out.write('</div></div>\n')
+
+        summary_path = os.path.join(self.ai_report_dir, 'latest_analysis.md')
+        if os.path.exists(summary_path) and os.path.getsize(summary_path):
+            out.write('<h2>AI Summary</h2>\n<pre>')
+            with open(summary_path) as f:
+                out.write(html.escape(f.read()))
+            out.write('</pre>\n')
+
+        analyses = self._load_analyses()
+        if analyses:
+            out.write('<h2>AI Analysis</h2>\n')
+            for entry in analyses:
+                heading = f"{entry.get('analysis_type', '')} ({entry.get('status', '')})"
+                out.write(f'<div class="extraHTML"><h3>{html.escape(heading)}</h3><pre>')
+                out.write(html.escape(json.dumps(entry.get('result', {}), indent=2, default=str)))
+                out.write('</pre></div>\n')
+
+        out.write('<table id="results-table">\n<thead id="results-table-head"><tr>'
+                  '<th class="sortable" data-column-type="result">Result</th>'
+                  '<th class="sortable" data-column-type="testId">Test</th>'
+                  '<th>Executions</th><th>Failures</th></tr></thead>\n')
+
+    def generate(self) -> Dict[str, int]:
+        """
+        Build the report, re-rendering only fragments whose inputs changed.
+
+        Returns:
+            Counts of rendered and reused fragments
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        os.makedirs(os.path.dirname(self.output_path) or '.', exist_ok=True)
+
+        grouped = self._load_records()
+        screenshots = self._load_screenshots()
+        previous = self._load_manifest()
+        manifest: Dict[str, str] = {}
+        stats = {"rendered": 0, "reused": 0}
+        claimed: Set[str] = set()
+
+        tmp_path = self.output_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            self._write_header(out, grouped)
+            for test_name, records in grouped.items():
+                matched = self._match_screenshots(test_name, records, screenshots, grouped, claimed)
+                key = self._fragment_key(test_name, records, matched)
+                fragment_path = os.path.join(self.cache_dir, f"{key}.html")
+
+                if previous.get(test_name) == key and os.path.exists(fragment_path):
+                    stats["reused"] += 1
+                    REPORT_FRAGMENTS.inc(outcome="reused")
+                else:
+                    with open(fragment_path, 'w', encoding='utf-8') as f:
+                        f.write(self._render_fragment(test_name, records, matched))
+                    stats["rendered"] += 1
+                    REPORT_FRAGMENTS.inc(outcome="rendered")
+                manifest[test_name] = key
+
+                with open(fragment_path, encoding='utf-8') as f:
+                    shutil.copyfileobj(f, out)
+            out.write('</table>\n</body>\n</html>\n')
+        os.replace(tmp_path, self.output_path)
+
+        for stale in set(previous.values()) - set(manifest.values()):
+            try:
+                os.remove(os.path.join(self.cache_dir, f"{stale}.html"))
+            except FileNotFoundError:
+                pass
+        self._save_manifest(manifest)
+
+        logger.info(f"Report written to {self.output_path}: "
+                    f"{stats['rendered']} fragments rendered, {stats['reused']} reused")
+        return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the HTML test report")
+    parser.add_argument("--log", help="Path to the JSON run log")
+    parser.add_argument("--output", help="Path of the generated HTML report")
+    parser.add_argument("--link-screenshots", action="store_true",
+                        help="Link screenshots instead of embedding them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    generator = ReportGenerator(args.log, args.output, embed_screenshots=not args.link_screenshots)
+    print(generator.generate())
+    metrics.export()
@@ -0,0 +1,148 @@
+# tests_suite/rollups.py
+import json
+import logging
+import os
+import sqlite3
+from configparser import ConfigParser
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    date TEXT NOT NULL,
+    testname TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    first_timestamp TEXT NOT NULL,
+    last_timestamp TEXT NOT NULL,
+    last_error TEXT,
+    PRIMARY KEY (date, testname, status)
+);
+CREATE TABLE IF NOT EXISTS rollup_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO daily_rollup (date, testname, status, count, first_timestamp, last_timestamp, last_error)
+VALUES (?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (date, testname, status) DO UPDATE SET
+    count = count + 1,
+    first_timestamp = MIN(first_timestamp, excluded.first_timestamp),
+    last_error = CASE WHEN excluded.last_timestamp >= last_timestamp
+                      THEN excluded.last_error ELSE last_error END,
+    last_timestamp = MAX(last_timestamp, excluded.last_timestamp)
+"""
+
+
+def _upsert_args(entry: Dict):
+    timestamp = entry['timestamp']
+    return (timestamp[:10], entry['testname'], entry.get('status'), timestamp, timestamp, entry.get('error'))
+
+
+class RollupStore:
+    """
+    Per day x test x status execution counts, maintained as results are logged.
+
+    Records already in the raw log when the store is first created are folded
+    in once by ``backfill``. The store saves the log size at creation time, so
+    that only lines older than the ingest-time rollups are backfilled.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, log_path: Optional[str] = None):
+        config = ConfigParser()
+        config.read('config/config.ini')
+        self.db_path = db_path or config.get('PATHS', 'ROLLUP_DB', fallback='reports/logs/rollups.db')
+        self.log_path = log_path or config.get('PATHS', 'LOG_FILE', fallback='reports/logs/test_logs.json')
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+            conn.execute("INSERT OR IGNORE INTO rollup_meta (key, value) VALUES ('backfill_offset', ?)",
+                         (str(size),))
+
+    @contextmanager
+    def _transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        # Parallel test workers write to the same file, so wait on locks rather than fail.
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            if immediate:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM rollup_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def record(self, testname: str, status: str, timestamp: str, error: Optional[str] = None):
+        """Fold one test result into its daily rollup row"""
+        try:
+            with self._transaction() as conn:
+                conn.execute(UPSERT, _upsert_args(
+                    {"testname": testname, "status": status, "timestamp": timestamp, "error": error}))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to update rollup for {testname}: {str(e)}")
+
+    def _fold_log(self, conn: sqlite3.Connection, limit: Optional[int] = None) -> int:
+        rows = 0
+        with open(self.log_path, 'rb') as f:
+            while limit is None or f.tell() < limit:
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not entry.get('timestamp') or not entry.get('testname'):
+                    continue
+                conn.execute(UPSERT, _upsert_args(entry))
+                rows += 1
+        return rows
+
+    def backfill(self) -> int:
+        """Fold raw-log records that predate this store, once; returns the number folded"""
+        # Plain read first: the write lock is only taken while a backfill is still due,
+        # so dashboard reruns do not contend with test workers recording results.
+        with self._transaction() as conn:
+            if self._meta(conn, 'backfill_done'):
+                return 0
+        with self._transaction(immediate=True) as conn:
+            if self._meta(conn, 'backfill_done') or not os.path.exists(self.log_path):
+                return 0
+            rows = self._fold_log(conn, int(self._meta(conn, 'backfill_offset') or 0))
+            conn.execute("INSERT OR REPLACE INTO rollup_meta (key, value) VALUES ('backfill_done', '1')")
+        if rows:
+            logger.info(f"Backfilled {rows} records from {self.log_path} into rollups")
+        return rows
+
+    def rebuild(self) -> int:
+        """Recreate all rollups from the raw log, e.g. after it was edited by hand"""
+        with self._transaction(immediate=True) as conn:
+            conn.execute("DELETE FROM daily_rollup")
+            rows = self._fold_log(conn) if os.path.exists(self.log_path) else 0
+            conn.execute("INSERT OR REPLACE INTO rollup_meta (key, value) VALUES ('backfill_done', '1')")
+        return rows
+
+    def query(self, start: date, end: date) -> List[Dict]:
+        """Rollup rows with start <= date <= end"""
+        with self._transaction() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT * FROM daily_rollup WHERE date BETWEEN ? AND ? ORDER BY date, testname, status",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -9,8 +9,15 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Optional, Tuple
 from configparser import ConfigParser
 
+from instrumentation import metrics
+
 logger = logging.getLogger(__name__)
 
+SCREENSHOT_SECONDS = metrics.histogram(
+    "screenshot_seconds", "Time spent capturing and annotating screenshots")
+SCREENSHOT_FAILURES = metrics.counter(
+    "screenshot_failures_total", "Screenshot operations that raised")
+
 
 class ScreenshotManager:
     """Advanced screenshot utility with annotation and error handling"""
@@ -32,67 +39,73 @@ class ScreenshotManager:
 
     def capture_full_screenshot(self) -> Optional[str]:
         """Capture full-page screenshot (works for Chrome/Firefox)"""
-        try:
-            original_size = self.driver.get_window_size()
-
-            if self.driver.name.lower() == 'chrome':
-                total_height = self.driver.execute_script(
-                    "return document.body.parentNode.scrollHeight")
-                self.driver.set_window_size(1920, total_height)
-
-            filename = os.path.join(self.base_dir, self._generate_filename('full'))
-            self.driver.save_screenshot(filename)
-
-            # Restore original window size
-            self.driver.set_window_size(
-                original_size['width'],
-                original_size['height']
-            )
-            return filename
-
-        except Exception as e:
-            logger.error(f"Failed to capture full screenshot: {str(e)}")
-            return None
+        with metrics.timer(SCREENSHOT_SECONDS, operation='full'):
+            try:
+                original_size = self.driver.get_window_size()
+
+                if self.driver.name.lower() == 'chrome':
+                    total_height = self.driver.execute_script(
+                        "return document.body.parentNode.scrollHeight")
+                    self.driver.set_window_size(1920, total_height)
+
+                filename = os.path.join(self.base_dir, self._generate_filename('full'))
+                self.driver.save_screenshot(filename)
+
+                # Restore original window size
+                self.driver.set_window_size(
+                    original_size['width'],
+                    original_size['height']
+                )
+                return filename
+
+            except Exception as e:
+                logger.error(f"Failed to capture full screenshot: {str(e)}")
+                SCREENSHOT_FAILURES.inc(operation='full')
+                return None
 
     def capture_element_screenshot(self, element, padding: int = 10) -> Optional[str]:
         """Capture screenshot of specific element with padding"""
-        try:
-            location = element.location_once_scrolled_into_view
-            size = element.size
-
-            filename = os.path.join(self.base_dir, self._generate_filename('element'))
-            self.driver.save_screenshot(filename)
-
-            # Crop to element coordinates
-            img = Image.open(filename)
-            left = location['x'] - padding
-            top = location['y'] - padding
-            right = location['x'] + size['width'] + padding
-            bottom = location['y'] + size['height'] + padding
-
-            img = img.crop((left, top, right, bottom))
-            img.save(filename)
-            return filename
-
-        except Exception as e:
-            logger.error(f"Failed to capture element screenshot: {str(e)}")
-            return None
+        with metrics.timer(SCREENSHOT_SECONDS, operation='element'):
+            try:
+                location = element.location_once_scrolled_into_view
+                size = element.size
+
+                filename = os.path.join(self.base_dir, self._generate_filename('element'))
+                self.driver.save_screenshot(filename)
+
+                # Crop to element coordinates
+                img = Image.open(filename)
+                left = location['x'] - padding
+                top = location['y'] - padding
+                right = location['x'] + size['width'] + padding
+                bottom = location['y'] + size['height'] + padding
+
+                img = img.crop((left, top, right, bottom))
+                img.save(filename)
+                return filename
+
+            except Exception as e:
+                logger.error(f"Failed to capture element screenshot: {str(e)}")
+                SCREENSHOT_FAILURES.inc(operation='element')
+                return None
 
     def annotate_screenshot(self, image_path: str, text: str,
                             position: Tuple[int, int] = (10, 10)) -> str:
         """Add annotations to existing screenshot"""
-        try:
-            with Image.open(image_path) as img:
-                draw = ImageDraw.Draw(img)
-                draw.text(position, text, fill='red')
-
-                annotated_path = image_path.replace('.png', '_annotated.png')
-                img.save(annotated_path)
-                return annotated_path
-
-        except Exception as e:
-            logger.error(f"Failed to annotate screenshot: {str(e)}")
-            return image_path
+        with metrics.timer(SCREENSHOT_SECONDS, operation='annotate'):
+            try:
+                with Image.open(image_path) as img:
+                    draw = ImageDraw.Draw(img)
+                    draw.text(position, text, fill='red')
+
+                    annotated_path = image_path.replace('.png', '_annotated.png')
+                    img.save(annotated_path)
+                    return annotated_path
+
+            except Exception as e:
+                logger.error(f"Failed to annotate screenshot: {str(e)}")
+                SCREENSHOT_FAILURES.inc(operation='annotate')
+                return image_path
 
     def capture_and_log(self, context: str = '') -> Optional[str]:
         """Full workflow: capture, annotate, and return path"""
@@ -8,14 +8,14 @@ logger = JSONLogger()
 
 class TestLogin:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.driver = browser_factory.get_driver()
+    def setup(self, browser_profile):
+        self.driver = browser_factory.get_driver(**browser_profile)
         self.login_page = login_page(self.driver)
         yield
         self.driver.quit()
 
     def test_valid_login(self):
-        screenshot = ScreenshotManager(self.driver)
+        screenshot = ScreenshotManager(self.driver, test_id="verify_home_page_title")
         try:
             self.login_page.navigate()
             self.login_page.enter_credentials("tomsmith", "SuperSecretPassword!")
@@ -31,7 +31,7 @@ class TestLogin:
             pytest.fail(str(e))
 
     def test_invalid_username(self):
-        screenshot = ScreenshotManager(self.driver)
+        screenshot = ScreenshotManager(self.driver, test_id="verify_login_with_invalid_username")
         try:
             self.login_page.navigate()
             self.login_page.enter_credentials("sachin", "invalidPassword!")
@@ -48,7 +48,7 @@ class TestLogin:
             pytest.fail(str(e))
 
     def test_with_login(self):
-        screenshot = ScreenshotManager(self.driver)
+        screenshot = ScreenshotManager(self.driver, test_id="verify_login_with_valid_credential")
         try:
             self.login_page.navigate()
             self.login_page.enter_credentials("tomsmith", "SuperSecretPassword!")
@@ -64,7 +64,7 @@ class TestLogin:
             pytest.fail(str(e))
 
     def test_invalid_password(self):
-        screenshot = ScreenshotManager(self.driver)
+        screenshot = ScreenshotManager(self.driver, test_id="verify_login_with_invalid_password")
         try:
             self.login_page.navigate()
             self.login_page.enter_credentials("tomsmith", "invalidPassword!")
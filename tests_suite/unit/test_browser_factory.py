@@ -0,0 +1,115 @@
+import os
+from configparser import ConfigParser
+
+import pytest
+
+
+@pytest.fixture
+def factory():
+    pytest.importorskip("selenium")
+    from tests_suite import browser_factory
+    return browser_factory
+
+
+def _config(**fast_profile):
+    config = ConfigParser()
+    config.read_dict({"FAST_PROFILE": fast_profile})
+    return config
+
+
+# ----------------------------------------------------------------------
+# fast_profile_settings
+# ----------------------------------------------------------------------
+def test_missing_block_urls_uses_defaults(factory):
+    settings = factory.browser_factory.fast_profile_settings(_config())
+    assert settings["block_urls"] == factory.DEFAULT_BLOCKED_URLS
+    assert settings["page_load_strategy"] == "eager"
+    assert settings["profile_dir"] is None
+
+
+def test_empty_block_urls_disables_blocking(factory):
+    settings = factory.browser_factory.fast_profile_settings(_config(BLOCK_URLS=""))
+    assert settings["block_urls"] == []
+
+
+def test_block_urls_are_split_and_stripped(factory):
+    settings = factory.browser_factory.fast_profile_settings(_config(BLOCK_URLS=" *a.com* , *b.com*,"))
+    assert settings["block_urls"] == ["*a.com*", "*b.com*"]
+
+
+def test_overrides_replace_config_values(factory):
+    settings = factory.browser_factory.fast_profile_settings(
+        _config(DISABLE_IMAGES="True"), disable_images=False, page_load_strategy="none")
+    assert settings["disable_images"] is False
+    assert settings["page_load_strategy"] == "none"
+
+
+def test_string_block_urls_override_is_one_pattern(factory):
+    settings = factory.browser_factory.fast_profile_settings(_config(), block_urls="*ads.example*")
+    assert settings["block_urls"] == ["*ads.example*"]
+
+
+@pytest.mark.parametrize("overrides", [{"disable_imgs": True}, {"block_urls": 5}])
+def test_invalid_overrides_are_rejected(factory, overrides):
+    with pytest.raises(ValueError):
+        factory.browser_factory.fast_profile_settings(_config(), **overrides)
+
+
+# ----------------------------------------------------------------------
+# get_driver / benchmark argument checks (raise before any browser starts)
+# ----------------------------------------------------------------------
+def test_overrides_with_default_profile_are_rejected(factory):
+    with pytest.raises(ValueError, match="disable_images"):
+        factory.browser_factory.get_driver("default", disable_images=False)
+
+
+def test_unknown_profile_is_rejected(factory):
+    with pytest.raises(ValueError, match="turbo"):
+        factory.browser_factory.get_driver("turbo")
+
+
+@pytest.mark.parametrize("urls, runs", [([], 5), (["http://localhost"], 0)])
+def test_benchmark_rejects_empty_inputs(factory, urls, runs):
+    with pytest.raises(ValueError):
+        factory.browser_factory.benchmark(urls, runs=runs)
+
+
+def test_profile_copy_skips_locks_and_is_removed_on_quit(factory, tmp_path):
+    template = tmp_path / "profile"
+    (template / "Default").mkdir(parents=True)
+    (template / "Default" / "Preferences").write_text("{}")
+    (template / "SingletonLock").write_text("")
+
+    copy = factory.browser_factory._copy_profile(str(template))
+    assert os.path.exists(os.path.join(copy, "Default", "Preferences"))
+    assert not os.path.exists(os.path.join(copy, "SingletonLock"))
+
+    class Driver:
+        quits = 0
+
+        def quit(self):
+            self.quits += 1
+
+    driver = Driver()
+    factory.browser_factory._remove_on_quit(driver, copy)
+    driver.quit()
+    assert driver.quits == 1
+    assert not os.path.exists(copy)
+    assert (template / "SingletonLock").exists()
+
+
+# ----------------------------------------------------------------------
+# browser_profile fixture (tests_suite/conftest.py)
+# ----------------------------------------------------------------------
+def test_unmarked_test_uses_configured_profile(browser_profile):
+    assert browser_profile == {}
+
+
+@pytest.mark.browser_profile
+def test_bare_marker_means_fast(browser_profile):
+    assert browser_profile == {"profile": "fast"}
+
+
+@pytest.mark.browser_profile("fast", disable_images=False, block_urls="*ads*")
+def test_marker_options_are_passed_through(browser_profile):
+    assert browser_profile == {"profile": "fast", "disable_images": False, "block_urls": "*ads*"}
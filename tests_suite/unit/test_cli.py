@@ -0,0 +1,102 @@
+import json
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ai_analysis import cli
+
+
+class StubAnalyzer:
+    def __init__(self, results, delay=0.0):
+        self.results = results
+        self.delay = delay
+
+    def analyze_logs(self, log_path, analysis_type):
+        time.sleep(self.delay)
+        return dict(self.results[analysis_type])
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "test_logs.json"
+    path.write_text('{"testname": "t", "status": "FAIL"}\n')
+    return str(path)
+
+
+@pytest.mark.parametrize("raw, expected", [(80, 0.8), ("35", 0.35), (1, 0.01), (0, 0.0), ("n/a", None)])
+def test_score_is_read_as_a_percentage(raw, expected):
+    assert cli._score({"flakiness_score": raw}, "flakiness") == expected
+
+
+def test_nearly_stable_test_does_not_breach(log_file):
+    analyzer = StubAnalyzer({"flakiness": {"flakiness_score": 1}})
+    results = cli.run_analyses(analyzer, [log_file], ["flakiness"], 2, 0.7, 5)
+    assert results[0]["status"] == "ok"
+
+
+def test_flakiness_at_threshold_breaches(log_file):
+    analyzer = StubAnalyzer({"flakiness": {"flakiness_score": 70}})
+    results = cli.run_analyses(analyzer, [log_file], ["flakiness"], 2, 0.7, 5)
+    assert results[0]["status"] == "breached"
+    assert cli.exit_code(results) == cli.EXIT_THRESHOLD_BREACHED
+
+
+def test_confident_root_cause_does_not_gate_by_default(log_file):
+    analyzer = StubAnalyzer({"root_cause": {"confidence_score": 95, "root_causes": ["x"]}})
+    results = cli.run_analyses(analyzer, [log_file], ["root_cause"], 2, 0.7, 5)
+    assert results[0]["status"] == "ok"
+    assert results[0]["score"] == 0.95
+    assert cli.exit_code(results) == cli.EXIT_OK
+
+
+def test_below_gate_breaches_on_low_confidence(log_file):
+    analyzer = StubAnalyzer({"root_cause": {"confidence_score": 40}})
+    results = cli.run_analyses(analyzer, [log_file], ["root_cause"], 2, 0.7, 5, gates={"root_cause": "below"})
+    assert results[0]["status"] == "breached"
+
+
+def test_missing_log_and_unparsed_response_are_errors(log_file):
+    analyzer = StubAnalyzer({"flakiness": {"raw_response": "not json"}})
+    results = cli.run_analyses(analyzer, [log_file, "missing.json"], ["flakiness"], 2, 0.7, 5)
+    assert [r["status"] for r in results] == ["error", "error"]
+    assert cli.exit_code(results) == cli.EXIT_ANALYSIS_ERROR
+
+
+def test_unfinished_analyses_time_out_within_budget(log_file):
+    analyzer = StubAnalyzer({"flakiness": {"flakiness_score": 10}}, delay=2)
+    start = time.monotonic()
+    results = cli.run_analyses(analyzer, [log_file], ["flakiness"], 1, 0.7, 0.2)
+    assert time.monotonic() - start < 1
+    assert results[0]["status"] == "timed_out"
+    assert cli.exit_code(results) == cli.EXIT_TIMED_OUT
+
+
+def test_exit_code_precedence():
+    def statuses(*values):
+        return [{"status": v} for v in values]
+    assert cli.exit_code(statuses("ok", "breached", "error", "timed_out")) == cli.EXIT_TIMED_OUT
+    assert cli.exit_code(statuses("ok", "breached", "error")) == cli.EXIT_ANALYSIS_ERROR
+    assert cli.exit_code(statuses("ok", "breached")) == cli.EXIT_THRESHOLD_BREACHED
+    assert cli.exit_code(statuses("ok")) == cli.EXIT_OK
+
+
+def test_formatters(log_file):
+    analyzer = StubAnalyzer({
+        "root_cause": {"confidence_score": 90, "root_causes": ["stale locator"]},
+        "flakiness": {"flakiness_score": 80},
+    })
+    results = cli.run_analyses(analyzer, [log_file], ["root_cause", "flakiness"], 2, 0.7, 5)
+    meta = {"provider": "groq", "threshold": 0.7, "exit_code": cli.exit_code(results)}
+
+    assert json.loads(cli.format_json(results, meta))["results"][1]["status"] == "breached"
+
+    markdown = cli.format_markdown(results, meta)
+    assert "| flakiness | breached | 0.80 |" in markdown
+
+    suite = ET.fromstring(cli.format_junit(results, meta))
+    assert suite.get("tests") == "2" and suite.get("failures") == "1"
+    root_cause = suite.find("testcase[@name='root_cause']")
+    props = {p.get("name"): p.get("value") for p in root_cause.find("properties")}
+    assert props["root_causes"] == '["stale locator"]'
+    assert suite.find("testcase[@name='flakiness']/failure") is not None
@@ -0,0 +1,151 @@
+import pytest
+
+from instrumentation.metrics import MetricsRegistry, timer
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = registry.histogram("call_seconds", "Call latency", buckets=(0.1, 1, 10))
+    for value in (0.05, 0.5, 0.5, 5, 50):
+        latency.observe(value, provider="groq")
+
+    assert registry.render().splitlines() == [
+        "# HELP call_seconds Call latency",
+        "# TYPE call_seconds histogram",
+        'call_seconds_bucket{provider="groq",le="0.1"} 1',
+        'call_seconds_bucket{provider="groq",le="1"} 3',
+        'call_seconds_bucket{provider="groq",le="10"} 4',
+        'call_seconds_bucket{provider="groq",le="+Inf"} 5',
+        'call_seconds_sum{provider="groq"} 56.05',
+        'call_seconds_count{provider="groq"} 5',
+    ]
+
+
+def test_counter_labels_are_sorted_and_escaped(registry):
+    tokens = registry.counter("tokens_total", "Tokens")
+    tokens.inc(3, model='llama"3', kind="prompt")
+    tokens.inc(2, model='llama"3', kind="prompt")
+    tokens.inc()
+
+    assert tokens.value(kind="prompt", model='llama"3') == 5
+    assert registry.render().splitlines()[2:] == [
+        "tokens_total 1",
+        'tokens_total{kind="prompt",model="llama\\"3"} 5',
+    ]
+
+
+def test_metrics_render_in_name_order_and_types_cannot_clash(registry):
+    registry.counter("b_total", "B").inc()
+    registry.histogram("a_seconds", "A", buckets=(1,))
+    assert registry.counter("b_total", "ignored").value() == 1
+    with pytest.raises(ValueError):
+        registry.histogram("b_total", "B")
+    assert [line for line in registry.render().splitlines() if line.startswith("# TYPE")] == [
+        "# TYPE a_seconds histogram",
+        "# TYPE b_total counter",
+    ]
+
+
+def test_timer_observes_even_when_block_raises(registry):
+    duration = registry.histogram("block_seconds", "Block")
+    with pytest.raises(RuntimeError):
+        with timer(duration, phase="load"):
+            raise RuntimeError
+    assert duration.count(phase="load") == 1
+
+
+def test_export_writes_the_rendered_registry(tmp_path):
+    from instrumentation import metrics
+
+    metrics.counter("export_test_total", "Export test").inc()
+    path = metrics.export(str(tmp_path / "out" / "pytest.prom"))
+    with open(path) as f:
+        assert "export_test_total 1" in f.read()
+
+
+# ----------------------------------------------------------------------
+# TestAnalyzer instrumentation
+# ----------------------------------------------------------------------
+@pytest.fixture
+def analyzer_module():
+    pytest.importorskip("langchain")
+    from ai_analysis import analyzer
+    return analyzer
+
+
+@pytest.fixture
+def analyzer(analyzer_module):
+    # Skip model initialisation; only the instrumented helpers are exercised.
+    instance = analyzer_module.TestAnalyzer.__new__(analyzer_module.TestAnalyzer)
+    instance.model_type = "stub"
+    instance.model_name = "stub-model"
+    return instance
+
+
+class StubChain:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    def invoke(self, inputs, config=None):
+        if self.error:
+            raise self.error
+        return self.response
+
+
+class StubMessage:
+    def __init__(self, content, usage_metadata=None):
+        self.content = content
+        self.usage_metadata = usage_metadata
+
+
+def test_invoke_records_latency_outcome_and_tokens(analyzer_module, analyzer):
+    labels = {"provider": "stub", "model": "stub-model"}
+    latency_before = analyzer_module.LLM_REQUEST_SECONDS.count(analysis_type="flakiness", **labels)
+    success_before = analyzer_module.LLM_REQUESTS.value(outcome="success", **labels)
+    prompt_before = analyzer_module.LLM_TOKENS.value(kind="prompt", **labels)
+    completion_before = analyzer_module.LLM_TOKENS.value(kind="completion", **labels)
+
+    response = StubMessage("{}", usage_metadata={"input_tokens": 120, "output_tokens": 30})
+    assert analyzer._invoke(StubChain(response), {}, "flakiness") is response
+
+    assert analyzer_module.LLM_REQUEST_SECONDS.count(analysis_type="flakiness", **labels) == latency_before + 1
+    assert analyzer_module.LLM_REQUESTS.value(outcome="success", **labels) == success_before + 1
+    assert analyzer_module.LLM_TOKENS.value(kind="prompt", **labels) == prompt_before + 120
+    assert analyzer_module.LLM_TOKENS.value(kind="completion", **labels) == completion_before + 30
+
+
+def test_invoke_records_errors_and_reraises(analyzer_module, analyzer):
+    labels = {"provider": "stub", "model": "stub-model"}
+    latency_before = analyzer_module.LLM_REQUEST_SECONDS.count(analysis_type="root_cause", **labels)
+    errors_before = analyzer_module.LLM_REQUESTS.value(outcome="error", **labels)
+    tokens_before = analyzer_module.LLM_TOKENS.value(kind="prompt", **labels)
+
+    with pytest.raises(TimeoutError):
+        analyzer._invoke(StubChain(error=TimeoutError("slow")), {}, "root_cause")
+
+    assert analyzer_module.LLM_REQUEST_SECONDS.count(analysis_type="root_cause", **labels) == latency_before + 1
+    assert analyzer_module.LLM_REQUESTS.value(outcome="error", **labels) == errors_before + 1
+    assert analyzer_module.LLM_TOKENS.value(kind="prompt", **labels) == tokens_before
+
+
+def test_plain_string_response_records_no_tokens(analyzer_module, analyzer):
+    labels = {"provider": "stub", "model": "stub-model"}
+    tokens_before = analyzer_module.LLM_TOKENS.value(kind="completion", **labels)
+    assert analyzer._invoke(StubChain('{"a": 1}'), {}, "flakiness") == '{"a": 1}'
+    assert analyzer_module.LLM_TOKENS.value(kind="completion", **labels) == tokens_before
+
+
+@pytest.mark.parametrize("response, failed", [
+    ('```json\n{"flakiness_score": 10}\n```', False),
+    ("no json here", True),
+    ("{not: valid json}", True),
+])
+def test_parse_failures_are_counted(analyzer_module, analyzer, response, failed):
+    before = analyzer_module.PARSE_FAILURES.value(provider="stub")
+    analyzer._parse_json_response(response)
+    assert analyzer_module.PARSE_FAILURES.value(provider="stub") == before + failed
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from tests_suite.report_generator import ReportGenerator
+
+
+def _write_log(path, records):
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def _record(testname, status, timestamp, error=None):
+    return {"testname": testname, "status": status, "timestamp": timestamp, "error": error, "msg": ""}
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    # No config/config.ini here, so every path falls back to its reports/ default.
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'reports' / 'logs').mkdir(parents=True)
+    log = tmp_path / 'reports' / 'logs' / 'test_logs.json'
+    _write_log(log, [
+        _record("test_a", "PASS", "2025-03-19T10:00:00"),
+        _record("test_b", "FAIL", "2025-03-19T10:01:00", "boom"),
+    ])
+    return log
+
+
+def test_second_build_reuses_every_fragment(workspace):
+    assert ReportGenerator().generate() == {"rendered": 2, "reused": 0}
+    assert ReportGenerator().generate() == {"rendered": 0, "reused": 2}
+
+
+def test_changed_test_is_the_only_fragment_rerendered(workspace):
+    ReportGenerator().generate()
+    _write_log(workspace, [
+        _record("test_a", "PASS", "2025-03-19T10:00:00"),
+        _record("test_b", "FAIL", "2025-03-19T10:01:00", "boom"),
+        _record("test_b", "PASS", "2025-03-19T11:00:00"),
+    ])
+
+    assert ReportGenerator().generate() == {"rendered": 1, "reused": 1}
+    with open('reports/test-report.html') as f:
+        assert f.read().count('results-table-row') == 2
+
+
+def test_cli_analysis_for_this_log_is_rendered(workspace):
+    (workspace.parent.parent / 'ai_reports').mkdir()
+    with open('reports/ai_reports/analysis.json', 'w') as f:
+        json.dump({"results": [
+            {"log": "reports/logs/test_logs.json", "analysis_type": "root_cause", "status": "ok",
+             "result": {"root_causes": ["stale locator"]}},
+            {"log": "reports/logs/other.json", "analysis_type": "root_cause", "status": "ok",
+             "result": {"root_causes": ["unrelated"]}},
+        ]}, f)
+
+    ReportGenerator().generate()
+    with open('reports/test-report.html') as f:
+        report = f.read()
+    assert "stale locator" in report
+    assert "unrelated" not in report
+
+
+def _screenshot(name):
+    path = 'reports/screenshots/' + name
+    with open(path, 'wb') as f:
+        f.write(b'png')
+    return path
+
+
+def test_screenshots_attach_to_the_test_they_are_named_after(workspace):
+    (workspace.parent.parent / 'screenshots').mkdir()
+    _write_log(workspace, [
+        {**_record("test_a", "FAIL", "2025-03-19T10:00:00", "a"), "asctime": "2025-03-19 10:00:00"},
+        {**_record("test_b", "FAIL", "2025-03-19T10:00:01", "b"), "asctime": "2025-03-19 10:00:01"},
+    ])
+    # test_b's capture happened first; test_a's never made it to disk.
+    b_shot = _screenshot("test_b_full_20250319_100002.png")
+
+    generator = ReportGenerator(embed_screenshots=False)
+    grouped = generator._load_records()
+    screenshots = generator._load_screenshots()
+    claimed = set()
+    assert generator._match_screenshots("test_a", grouped["test_a"], screenshots, grouped, claimed) == []
+    assert generator._match_screenshots("test_b", grouped["test_b"], screenshots, grouped, claimed) == [b_shot]
+
+
+def test_unnamed_screenshot_is_claimed_by_one_failure_only(workspace):
+    (workspace.parent.parent / 'screenshots').mkdir()
+    _write_log(workspace, [
+        {**_record("test_a", "FAIL", "2025-03-19T10:00:00", "a"), "asctime": "2025-03-19 10:00:00"},
+        {**_record("test_b", "FAIL", "2025-03-19T10:00:01", "b"), "asctime": "2025-03-19 10:00:01"},
+    ])
+    shot = _screenshot("0f8e2c1a-uuid_full_20250319_100002.png")
+
+    generator = ReportGenerator(embed_screenshots=False)
+    grouped = generator._load_records()
+    screenshots = generator._load_screenshots()
+    claimed = set()
+    assert generator._match_screenshots("test_a", grouped["test_a"], screenshots, grouped, claimed) == [shot]
+    assert generator._match_screenshots("test_b", grouped["test_b"], screenshots, grouped, claimed) == []
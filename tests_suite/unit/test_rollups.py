@@ -0,0 +1,100 @@
+import json
+import sqlite3
+import time
+from datetime import date
+
+import pytest
+
+from tests_suite.rollups import RollupStore
+
+
+def _line(testname, status, timestamp, error=None):
+    return json.dumps({"testname": testname, "status": status, "timestamp": timestamp, "error": error}) + "\n"
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "rollups.db"), tmp_path / "test_logs.json"
+
+
+def _rows(store, day="2025-03-19"):
+    d = date.fromisoformat(day)
+    return {(r["testname"], r["status"]): r for r in store.query(d, d)}
+
+
+def test_record_keeps_count_bounds_and_latest_error_out_of_order(paths):
+    db, log = paths
+    store = RollupStore(db, str(log))
+    store.record("login", "FAIL", "2025-03-19T12:00:00", "middle")
+    store.record("login", "FAIL", "2025-03-19T18:00:00", "latest")
+    store.record("login", "FAIL", "2025-03-19T06:00:00", "earliest")
+
+    row = _rows(store)[("login", "FAIL")]
+    assert row["count"] == 3
+    assert row["first_timestamp"] == "2025-03-19T06:00:00"
+    assert row["last_timestamp"] == "2025-03-19T18:00:00"
+    assert row["last_error"] == "latest"
+
+
+def test_rows_are_split_by_day_and_status(paths):
+    db, log = paths
+    store = RollupStore(db, str(log))
+    store.record("login", "PASS", "2025-03-19T10:00:00")
+    store.record("login", "FAIL", "2025-03-19T11:00:00", "boom")
+    store.record("login", "PASS", "2025-03-20T10:00:00")
+
+    assert set(_rows(store)) == {("login", "PASS"), ("login", "FAIL")}
+    assert _rows(store, "2025-03-20")[("login", "PASS")]["count"] == 1
+
+
+def test_backfill_folds_only_history_that_predates_the_store(paths):
+    db, log = paths
+    log.write_text(_line("login", "PASS", "2025-03-19T09:00:00") + _line("login", "PASS", "2025-03-19T10:00:00"))
+    store = RollupStore(db, str(log))
+
+    # A test run ingests a new result before the dashboard ever backfills.
+    with open(log, "a") as f:
+        f.write(_line("login", "PASS", "2025-03-19T11:00:00"))
+    store.record("login", "PASS", "2025-03-19T11:00:00")
+
+    assert RollupStore(db, str(log)).backfill() == 2
+    assert RollupStore(db, str(log)).backfill() == 0
+    row = _rows(store)[("login", "PASS")]
+    assert row["count"] == 3
+    assert row["first_timestamp"] == "2025-03-19T09:00:00"
+
+
+def test_rebuild_recomputes_from_the_raw_log(paths):
+    db, log = paths
+    store = RollupStore(db, str(log))
+    store.record("stale", "PASS", "2025-03-19T08:00:00")
+    log.write_text(
+        _line("login", "FAIL", "2025-03-19T10:00:00", "first")
+        + "not json\n"
+        + _line("login", "FAIL", "2025-03-19T09:00:00", "older")
+    )
+
+    assert store.rebuild() == 2
+    rows = _rows(store)
+    assert ("stale", "PASS") not in rows
+    assert rows[("login", "FAIL")]["count"] == 2
+    assert rows[("login", "FAIL")]["last_error"] == "first"
+    assert store.backfill() == 0
+
+
+def test_finished_backfill_does_not_take_the_write_lock(paths):
+    db, log = paths
+    log.write_text(_line("login", "PASS", "2025-03-19T09:00:00"))
+    store = RollupStore(db, str(log))
+    assert store.backfill() == 1
+
+    # A test worker holds the write lock; a dashboard rerun must still backfill-check instantly.
+    writer = sqlite3.connect(db, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        start = time.monotonic()
+        assert store.backfill() == 0
+        assert time.monotonic() - start < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
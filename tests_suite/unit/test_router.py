@@ -0,0 +1,166 @@
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from ai_analysis.router import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, ProviderRouter
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StubAnalyzer:
+    def __init__(self, result, delay=0.0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    def analyze_logs(self, log_path, analysis_type):
+        self.calls += 1
+        time.sleep(self.delay)
+        return dict(self.result)
+
+
+def _router(analyzers, hedge_delay=0.2, request_timeout=5):
+    router = ProviderRouter(list(analyzers))
+    router.hedge_default_delay = hedge_delay
+    router.request_timeout = request_timeout
+    router._analyzers = analyzers
+    return router
+
+
+# ----------------------------------------------------------------------
+# CircuitBreaker
+# ----------------------------------------------------------------------
+def test_breaker_opens_at_error_rate_after_min_requests():
+    breaker = CircuitBreaker("groq", min_requests=4, error_rate=0.5)
+    for ok in (True, False, True):
+        breaker.record(ok, 0.1)
+    assert breaker.state == CLOSED
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_counts_slow_answers_as_failures():
+    breaker = CircuitBreaker("groq", min_requests=2, error_rate=0.5, slow_seconds=1)
+    breaker.record(True, 5)
+    breaker.record(True, 5)
+    assert breaker.state == OPEN
+    assert breaker.latency_percentile(95, min_samples=1) is None
+
+
+def test_half_open_allows_one_trial_then_closes_on_success():
+    breaker = CircuitBreaker("groq", min_requests=1, cooldown_seconds=0)
+    breaker.record(False, 0.1)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker("groq", min_requests=1, cooldown_seconds=0)
+    breaker.record(False, 0.1)
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+
+
+def test_abandoned_trial_is_replaced_after_trial_timeout():
+    breaker = CircuitBreaker("groq", min_requests=1, cooldown_seconds=0, trial_timeout_seconds=0.1)
+    breaker.record(False, 0.1)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.15)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_router_breakers_abandon_trials_at_request_timeout():
+    router = ProviderRouter(["groq"])
+    assert router.breakers["groq"].trial_timeout_seconds == router.request_timeout
+
+
+def test_latency_percentile():
+    breaker = CircuitBreaker("groq")
+    for latency in range(1, 21):
+        breaker.record(True, latency / 10)
+    assert breaker.latency_percentile(95) == 1.9
+    assert breaker.latency_percentile(50) == 1.0
+
+
+# ----------------------------------------------------------------------
+# ProviderRouter
+# ----------------------------------------------------------------------
+def test_fast_primary_answers_without_hedging():
+    backup = StubAnalyzer({"confidence_score": 2})
+    router = _router({"groq": StubAnalyzer({"confidence_score": 1}), "ollama": backup})
+    assert router.analyze_logs("log.json") == {"confidence_score": 1}
+    assert backup.calls == 0
+
+
+def test_slow_primary_is_hedged_and_backup_wins():
+    router = _router({"groq": StubAnalyzer({"confidence_score": 1}, delay=2),
+                      "ollama": StubAnalyzer({"confidence_score": 2}, delay=0.05)})
+    start = time.monotonic()
+    assert router.analyze_logs("log.json") == {"confidence_score": 2}
+    assert time.monotonic() - start < 1
+
+
+def test_invalid_primary_fails_over_immediately():
+    router = _router({"groq": StubAnalyzer({"raw_response": "not json"}),
+                      "ollama": StubAnalyzer({"confidence_score": 2})}, hedge_delay=10)
+    start = time.monotonic()
+    assert router.analyze_logs("log.json") == {"confidence_score": 2}
+    assert time.monotonic() - start < 1
+
+
+def test_all_failed_reports_each_provider():
+    router = _router({"groq": StubAnalyzer({"error": "rate limited"}), "ollama": StubAnalyzer({})})
+    result = router.analyze_logs("log.json")
+    assert result["error"] == "All providers failed"
+    assert result["providers"] == {"groq": "rate limited", "ollama": "empty response"}
+
+
+def test_request_timeout_gives_up_on_stalled_providers():
+    router = _router({"groq": StubAnalyzer({"confidence_score": 1}, delay=3)}, request_timeout=0.2)
+    start = time.monotonic()
+    result = router.analyze_logs("log.json")
+    assert time.monotonic() - start < 1
+    assert "groq" in result["providers"]
+
+
+def test_open_circuit_is_skipped():
+    primary = StubAnalyzer({"confidence_score": 1})
+    router = _router({"groq": primary, "ollama": StubAnalyzer({"confidence_score": 2})})
+    router.breakers["groq"]._transition(OPEN)
+    router.breakers["groq"]._opened_at = time.monotonic()
+    assert router.analyze_logs("log.json") == {"confidence_score": 2}
+    assert primary.calls == 0
+
+
+def test_abandoned_hedge_does_not_delay_process_exit():
+    script = textwrap.dedent("""
+        import time
+        from ai_analysis.router import ProviderRouter
+
+        class Stub:
+            def __init__(self, delay):
+                self.delay = delay
+            def analyze_logs(self, log_path, analysis_type):
+                time.sleep(self.delay)
+                return {"confidence_score": 1}
+
+        router = ProviderRouter(["groq", "ollama"])
+        router.hedge_default_delay = 0.1
+        router._analyzers = {"groq": Stub(8), "ollama": Stub(0.1)}
+        router.analyze_logs("log.json")
+    """)
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, check=True, timeout=30)
+    assert time.monotonic() - start < 4